@@ -7,18 +7,19 @@ https://github.com/dpktjf/eto-irrigation
 
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.const import (
     CONF_NAME,
-    # CONF_SCAN_INTERVAL,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
     Platform,
 )
 from homeassistant.helpers.event import async_track_state_change_event
 
 from .api import ETOApiClient
 from .const import (
+    _LOGGER,
     CONF_ALBEDO,
     CONF_HUMIDITY_MAX,
     CONF_HUMIDITY_MIN,
@@ -35,16 +36,10 @@ if TYPE_CHECKING:
 
     from .data import ETOConfigEntry
 
-PLATFORMS: list[Platform] = [
-    Platform.SENSOR,
-    # Platform.BINARY_SENSOR,
-    # Platform.SWITCH,
-]
+PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 # https://homeassistantapi.readthedocs.io/en/latest/api.html
 
-DEFAULT_SCAN_INTERVAL = timedelta(seconds=10)
-
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
@@ -64,25 +59,20 @@ async def async_setup_entry(
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     coordinator = ETODataUpdateCoordinator(eto_api, hass)
 
-    _min_temp = entry.options.get(CONF_TEMP_MIN)
-    _max_temp = entry.options.get(CONF_TEMP_MAX)
-    _min_hum = entry.options.get(CONF_HUMIDITY_MIN)
-    _max_hum = entry.options.get(CONF_HUMIDITY_MAX)
-    _wind = entry.options.get(CONF_WIND)
-    _solar_rad = entry.options.get(CONF_SOLAR_RAD)
-    _albedo = entry.options.get(CONF_ALBEDO)
-    _entities = []
-    for entity in [
-        _min_temp,
-        _max_temp,
-        _min_hum,
-        _max_hum,
-        _wind,
-        _solar_rad,
-        _albedo,
-    ]:
-        if entity is not None:
-            _entities.append(entity)  # noqa: PERF401
+    options = entry.options
+    _entities = [
+        entity
+        for entity in (
+            options.get(CONF_TEMP_MIN),
+            options.get(CONF_TEMP_MAX),
+            options.get(CONF_HUMIDITY_MIN),
+            options.get(CONF_HUMIDITY_MAX),
+            options.get(CONF_WIND),
+            options.get(CONF_SOLAR_RAD),
+            options.get(CONF_ALBEDO),
+        )
+        if entity is not None
+    ]
     entry.async_on_unload(
         async_track_state_change_event(
             hass,
@@ -91,6 +81,18 @@ async def async_setup_entry(
         )
     )
 
+    # seed the client with whatever the input sensors already hold so the
+    # first refresh can calculate instead of waiting for each entity to
+    # report a change
+    for entity_id in _entities:
+        state = hass.states.get(entity_id)
+        if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+            continue
+        try:
+            eto_api.entity_update(entity_id, float(state.state))
+        except ValueError:
+            _LOGGER.debug("cannot seed %s from state %s", entity_id, state.state)
+
     await coordinator.async_config_entry_first_refresh()
 
     entry.async_on_unload(entry.add_update_listener(async_update_options))
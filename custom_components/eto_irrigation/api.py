@@ -3,20 +3,17 @@
 from __future__ import annotations
 
 import datetime
-from statistics import mean
+import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import (
     CONF_ELEVATION,
     CONF_LATITUDE,
     CONF_LONGITUDE,
-    UnitOfSpeed,
 )
-from homeassistant.util.unit_conversion import SpeedConverter
 
 from custom_components.eto_irrigation.api_helpers import (
     atm_pressure,
-    c_to_k,
     cs_rad,
     deg2rad,
     delta_svp,
@@ -76,6 +73,7 @@ from .const import (
     CONF_TEMP_MAX,
     CONF_TEMP_MIN,
     CONF_WIND,
+    KMH_TO_MS_FACTOR,
 )
 
 if TYPE_CHECKING:
@@ -113,6 +111,20 @@ class ETOApiClientCalculationStartupError(
 class ETOApiClient:
     """Sample API Client."""
 
+    __slots__ = (
+        "_calc_data",
+        "_config",
+        "_doy_cache",
+        "_entities",
+        "_last_sig",
+        "_lat_rad",
+        "_name",
+        "_p_atm",
+        "_psy",
+        "_solar_cache_key",
+        "_solar_cache_vals",
+    )
+
     def __init__(
         self,
         name: str,
@@ -123,32 +135,65 @@ class ETOApiClient:
     ) -> None:
         """Sample API Client."""
         self._name = name
-        self._entities = {}
-        self._entities[config.options[CONF_TEMP_MIN]] = None
-        self._entities[config.options[CONF_TEMP_MAX]] = None
-        self._entities[config.options[CONF_HUMIDITY_MIN]] = None
-        self._entities[config.options[CONF_HUMIDITY_MAX]] = None
-        self._entities[config.options[CONF_WIND]] = None
-        self._entities[config.options[CONF_SOLAR_RAD]] = None
-        self._entities[config.options[CONF_ALBEDO]] = None
-        self._calc_data = {}
-        self._calc_data[CONF_ELEVATION] = elevation
-        self._calc_data[CONF_LATITUDE] = latitude
-        self._calc_data[CONF_LONGITUDE] = longitude
-        self._calc_data[CONF_TEMP_MIN] = None
-        self._calc_data[CONF_TEMP_MAX] = None
-        self._calc_data[CONF_HUMIDITY_MIN] = None
-        self._calc_data[CONF_HUMIDITY_MAX] = None
-        self._calc_data[CONF_WIND] = None
-        self._calc_data[CONF_SOLAR_RAD] = None
-        self._calc_data[CONF_ALBEDO] = None
-        self._calc_data[CONF_DOY] = None
-        self._calc_data[CALC_FSETO_35] = None
+        # both mappings have a fixed schema, so build them in one shot from
+        # literals instead of growing them key by key
+        self._entities = dict.fromkeys(
+            (
+                config.options[CONF_TEMP_MIN],
+                config.options[CONF_TEMP_MAX],
+                config.options[CONF_HUMIDITY_MIN],
+                config.options[CONF_HUMIDITY_MAX],
+                config.options[CONF_WIND],
+                config.options[CONF_SOLAR_RAD],
+                config.options[CONF_ALBEDO],
+            )
+        )
+        self._calc_data = {
+            CONF_ELEVATION: elevation,
+            CONF_LATITUDE: latitude,
+            CONF_LONGITUDE: longitude,
+            CONF_TEMP_MIN: None,
+            CONF_TEMP_MAX: None,
+            CONF_HUMIDITY_MIN: None,
+            CONF_HUMIDITY_MAX: None,
+            CONF_WIND: None,
+            CONF_SOLAR_RAD: None,
+            CONF_ALBEDO: None,
+            CONF_DOY: None,
+            CALC_FSETO_35: None,
+        }
         self._config = config
-
-    async def entity_update(self, entity_id: str, new_state: float) -> None:
-        """Update to an entity pushed."""
+        # latitude and elevation never change for a configured zone, so the
+        # quantities derived from them (steps 5, 6 and 13) are fixed too
+        self._lat_rad = deg2rad(latitude)
+        self._p_atm = atm_pressure(elevation)
+        self._psy = psy_const(self._p_atm)
+        # solar geometry (steps 12-16) only depends on day-of-year, latitude
+        # and elevation, so it is memoized and recomputed at most once a day
+        self._solar_cache_key: tuple | None = None
+        self._solar_cache_vals: tuple | None = None
+        # day-of-year only changes at midnight; cache it per calendar day
+        self._doy_cache: tuple[datetime.date, int] | None = None
+        # signature of the inputs behind the last successful calculation;
+        # lets refreshes with unchanged sensors skip the whole pipeline
+        self._last_sig: tuple | None = None
+
+    def entity_update(self, entity_id: str, new_state: float) -> bool:
+        """Update to an entity pushed; return True if the value changed."""
+        if self._entities.get(entity_id) == new_state:
+            return False
         self._entities[entity_id] = new_state
+        return True
+
+    def _day_of_year(self) -> int:
+        """Return today's day of the year, recomputed only on date rollover."""
+        today = datetime.date.today()  # noqa: DTZ011
+        if self._doy_cache is None or self._doy_cache[0] != today:
+            # ordinal arithmetic beats timetuple(), which materializes a
+            # whole struct_time just to expose tm_yday
+            doy = today.toordinal() - datetime.date(today.year, 1, 1).toordinal() + 1
+            self._doy_cache = (today, doy)
+        return self._doy_cache[1]
 
     async def collect_calculation_data(self) -> None:
         """
@@ -157,53 +202,68 @@ class ETOApiClient:
         Convert into the correct units for calculation.
         """
         # https://developers.home-assistant.io/docs/core/entity/sensor
-        if (
-            self._entities[self._config.options[CONF_TEMP_MIN]] is None
-            or self._entities[self._config.options[CONF_TEMP_MAX]] is None
-            or self._entities[self._config.options[CONF_HUMIDITY_MIN]] is None
-            or self._entities[self._config.options[CONF_HUMIDITY_MAX]] is None
-            or self._entities[self._config.options[CONF_WIND]] is None
-            or self._entities[self._config.options[CONF_SOLAR_RAD]] is None
-            or self._entities[self._config.options[CONF_ALBEDO]] is None
+        opts = self._config.options
+        ents = self._entities
+        temp_min = ents[opts[CONF_TEMP_MIN]]
+        temp_max = ents[opts[CONF_TEMP_MAX]]
+        humidity_min = ents[opts[CONF_HUMIDITY_MIN]]
+        humidity_max = ents[opts[CONF_HUMIDITY_MAX]]
+        wind = ents[opts[CONF_WIND]]
+        solar_rad = ents[opts[CONF_SOLAR_RAD]]
+        albedo = ents[opts[CONF_ALBEDO]]
+        if any(
+            value is None
+            for value in (
+                temp_min,
+                temp_max,
+                humidity_min,
+                humidity_max,
+                wind,
+                solar_rad,
+                albedo,
+            )
         ):
             _LOGGER.debug("no data yet")
             return
 
+        doy = self._day_of_year()
+        sig = (
+            temp_min,
+            temp_max,
+            humidity_min,
+            humidity_max,
+            wind,
+            solar_rad,
+            albedo,
+            doy,
+        )
+        if sig == self._last_sig:
+            # nothing changed since the last run; _calc_data is still valid
+            _LOGGER.debug("inputs unchanged; skipping recalculation")
+            return
+
         try:
-            self._calc_data[CONF_TEMP_MIN] = self._entities[
-                self._config.options[CONF_TEMP_MIN]
-            ]
-            self._calc_data[CONF_TEMP_MAX] = self._entities[
-                self._config.options[CONF_TEMP_MAX]
-            ]
-            _LOGGER.debug(
-                "temp min/max = %s/%s",
-                self._calc_data[CONF_TEMP_MIN],
-                self._calc_data[CONF_TEMP_MAX],
-            )
-            self._calc_data[CONF_HUMIDITY_MIN] = (
-                self._entities[self._config.options[CONF_HUMIDITY_MIN]] / 100
-            )
-            self._calc_data[CONF_HUMIDITY_MAX] = (
-                self._entities[self._config.options[CONF_HUMIDITY_MAX]] / 100
-            )
-            self._calc_data[CONF_WIND] = self._entities[self._config.options[CONF_WIND]]
-            self._calc_data[CONF_WIND] = SpeedConverter.convert(
-                self._calc_data[CONF_WIND],
-                UnitOfSpeed.KILOMETERS_PER_HOUR,
-                UnitOfSpeed.METERS_PER_SECOND,
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("temp min/max = %s/%s", temp_min, temp_max)
+            self._calc_data.update(
+                {
+                    CONF_TEMP_MIN: temp_min,
+                    CONF_TEMP_MAX: temp_max,
+                    CONF_HUMIDITY_MIN: humidity_min / 100,
+                    CONF_HUMIDITY_MAX: humidity_max / 100,
+                    CONF_WIND: wind * KMH_TO_MS_FACTOR,
+                    CONF_SOLAR_RAD: solar_rad,
+                    CONF_ALBEDO: albedo,
+                    CONF_DOY: doy,
+                }
             )
-            self._calc_data[CONF_SOLAR_RAD] = self._entities[
-                self._config.options[CONF_SOLAR_RAD]
-            ]
-            self._calc_data[CONF_ALBEDO] = self._entities[
-                self._config.options[CONF_ALBEDO]
-            ]
-            self._calc_data[CONF_DOY] = datetime.datetime.now().timetuple().tm_yday  # noqa: DTZ005
 
             await self.calc_eto()
-
-            _LOGGER.debug("collect_calculation_data: %s", self._calc_data)
+            self._last_sig = sig
+            # round the published wind speed once here - calc_eto has
+            # already consumed the full-precision value - so the sensor
+            # does not re-round it on every attribute read
+            self._calc_data[CONF_WIND] = round(self._calc_data[CONF_WIND], 1)
         except ValueError as exception:
             msg = f"Value error fetching information - {exception}"
             _LOGGER.exception(msg)
@@ -222,129 +282,138 @@ class ETOApiClient:
         await self.collect_calculation_data()
         return self._calc_data
 
+    def _solar_geometry(self, doy: int) -> tuple:
+        """
+        Return (dr, sd, lat_rad, sha, ra, rso) for steps 12-16.
+
+        These only depend on day-of-year, latitude and elevation, so
+        yesterday's values are reused unless the day rolled over.
+        """
+        calc = self._calc_data
+        key = (doy, calc[CONF_LATITUDE], calc[CONF_ELEVATION])
+        if key != self._solar_cache_key:
+            """Step 12: The inverse relative distance Earth-Sun (dr) and solar
+            declination (d)"""
+            dr = inv_rel_dist_earth_sun(doy)
+            sd = sol_dec(doy)
+
+            """Step 13: Latitude (φ) in radians; fixed, computed in __init__"""
+            lat_rad = self._lat_rad
+
+            """Step 14: Sunset hour angle (ωs)"""
+            sha = sunset_hour_angle(lat_rad, sd)
+
+            """Step 15: Extraterrestrial radiation (Ra)"""
+            ra = et_rad(lat_rad, sd, sha, dr)
+
+            """Step 16: Clear sky solar radiation (Rso)"""
+            rso = cs_rad(calc[CONF_ELEVATION], ra)
+
+            self._solar_cache_key = key
+            self._solar_cache_vals = (dr, sd, lat_rad, sha, ra, rso)
+        return self._solar_cache_vals
+
     async def calc_eto(self) -> None:
-        """Perform ETO calculation."""
+        """
+        Perform ETO calculation.
+
+        The whole chain is evaluated in local variables (constant-offset
+        fast locals, no per-step dict hashing) and published into
+        _calc_data with a single bulk update at the end.
+        """
+        calc = self._calc_data
+        temp_min = calc[CONF_TEMP_MIN]
+        temp_max = calc[CONF_TEMP_MAX]
+        humidity_min = calc[CONF_HUMIDITY_MIN]
+        humidity_max = calc[CONF_HUMIDITY_MAX]
+        doy = calc[CONF_DOY]
+
         """Step 1: Mean daily temperature."""
-        self._calc_data[CALC_S1_5] = mean(
-            [self._calc_data[CONF_TEMP_MIN], self._calc_data[CONF_TEMP_MAX]]
-        )
+        t_mean = (temp_min + temp_max) * 0.5
 
         """Step 2: Mean daily solar radiation (Rs)."""
-        self._calc_data[CALC_S2_6] = self._calc_data[CONF_SOLAR_RAD] * 0.0864
+        rs = calc[CONF_SOLAR_RAD] * 0.0864
 
         """Step 3: The average daily wind speed in meters per second (ms-1)
         measured at 2m above the ground level is required. OWM reprts at 10m."""
-        self._calc_data[CALC_S3_7] = wind_speed(self._calc_data[CONF_WIND], 10)
+        u2 = wind_speed(calc[CONF_WIND], 10)
 
         """Step 4: For the calculation of evapotranspiration, the slope of
         the relationship between saturation vapor pressure and
         temperature, Δ, is required."""
-        self._calc_data[CALC_S4_9] = delta_svp(self._calc_data[CALC_S1_5])
-
-        """Step 5: Atmospheric Pressure (P)"""
-        self._calc_data[CALC_S5_10] = atm_pressure(self._calc_data[CONF_ELEVATION])
+        delta = delta_svp(t_mean)
 
-        """Step 6: Psychrometric constant (γ)"""  # noqa: RUF001
-        self._calc_data[CALC_S6_11] = psy_const(self._calc_data[CALC_S5_10])
+        """Steps 5 and 6: Atmospheric Pressure (P) and psychrometric
+        constant (γ); fixed, computed in __init__"""  # noqa: RUF001
+        p_atm = self._p_atm
+        psy = self._psy
 
         """Step 7: Delta Term (DT) (auxiliary calculation for Radiation Term)"""
-        self._calc_data[CALC_S7_12] = delta_term(
-            self._calc_data[CALC_S4_9],
-            self._calc_data[CALC_S6_11],
-            self._calc_data[CALC_S3_7],
-        )
+        dt = delta_term(delta, psy, u2)
 
         """Step 8: Psi Term (PT) (auxiliary calculation for Wind Term)"""
-        self._calc_data[CALC_S8_13] = psi_term(
-            self._calc_data[CALC_S4_9],
-            self._calc_data[CALC_S6_11],
-            self._calc_data[CALC_S3_7],
-        )
+        pt = psi_term(delta, psy, u2)
 
         """Step 9: Temperature Term (TT) (aux calculation for Wind Term)"""
-        self._calc_data[CALC_S9_14] = temperature_term(
-            self._calc_data[CALC_S1_5], self._calc_data[CALC_S3_7]
-        )
+        tt = temperature_term(t_mean, u2)
 
         """Step 10: Mean saturation vapor pressure derived from air temperature(es)"""
-        self._calc_data[CALC_S10_16] = svp_from_t(self._calc_data[CONF_TEMP_MAX])
-        self._calc_data[CALC_S10_17] = svp_from_t(self._calc_data[CONF_TEMP_MIN])
-        self._calc_data[CALC_S10_18] = mean(
-            [self._calc_data[CALC_S10_16], self._calc_data[CALC_S10_17]]
-        )
+        svp_tmax = svp_from_t(temp_max)
+        svp_tmin = svp_from_t(temp_min)
+        svp_mean = (svp_tmax + svp_tmin) * 0.5
 
         """Step 11: Actual vapor pressure (ea) derived from relative humidity"""
-        self._calc_data[CALC_S11_19] = mean(
-            [
-                ea_from_rh(
-                    self._calc_data[CALC_S10_16], self._calc_data[CONF_HUMIDITY_MIN]
-                ),
-                ea_from_rh(
-                    self._calc_data[CALC_S10_17], self._calc_data[CONF_HUMIDITY_MAX]
-                ),
-            ]
-        )
-
-        """Step 12: The inverse relative distance Earth-Sun (dr) and solar
-        declination (d)"""
-        self._calc_data[CALC_S12_23] = inv_rel_dist_earth_sun(self._calc_data[CONF_DOY])
-        self._calc_data[CALC_S12_24] = sol_dec(self._calc_data[CONF_DOY])
+        avp = (
+            ea_from_rh(svp_tmax, humidity_min) + ea_from_rh(svp_tmin, humidity_max)
+        ) * 0.5
 
-        """Step 13: Conversion of latitude (φ) in degrees to radians"""
-        self._calc_data[CALC_S13_25] = deg2rad(self._calc_data[CONF_LATITUDE])
-
-        """Step 14: Sunset hour angle (ωs)"""
-        self._calc_data[CALC_S14_26] = sunset_hour_angle(
-            self._calc_data[CALC_S13_25], self._calc_data[CALC_S12_24]
-        )
-
-        """Step 15: Extraterrestrial radiation (Ra)"""
-        self._calc_data[CALC_S15_27] = et_rad(
-            self._calc_data[CALC_S13_25],
-            self._calc_data[CALC_S12_24],
-            self._calc_data[CALC_S14_26],
-            self._calc_data[CALC_S12_23],
-        )
-
-        """Step 16: Clear sky solar radiation (Rso)"""
-        self._calc_data[CALC_S16_28] = cs_rad(
-            self._calc_data[CONF_ELEVATION], self._calc_data[CALC_S15_27]
-        )
+        """Steps 12-16: solar geometry, memoized per day in _solar_geometry."""
+        dr, sd, lat_rad, sha, ra, rso = self._solar_geometry(doy)
 
         """Step 17: Net solar or net shortwave radiation (Rns)"""
-        self._calc_data[CALC_S17_29] = net_in_sol_rad(
-            self._calc_data[CALC_S2_6], self._calc_data[CONF_ALBEDO]
-        )
+        rns = net_in_sol_rad(rs, calc[CONF_ALBEDO])
 
         """Step 18: Net outgoing long wave solar radiation (Rnl)"""
-        self._calc_data[CALC_S18_30] = net_out_lw_rad(
-            c_to_k(self._calc_data[CONF_TEMP_MIN]),
-            c_to_k(self._calc_data[CONF_TEMP_MAX]),
-            self._calc_data[CALC_S2_6],
-            self._calc_data[CALC_S16_28],
-            self._calc_data[CALC_S11_19],
-        )
+        rnl = net_out_lw_rad(temp_min, temp_max, rs, rso, avp)
 
         """Step 19: Net radiation (Rn)"""
-        self._calc_data[CALC_S19_31] = net_rad(
-            self._calc_data[CALC_S17_29], self._calc_data[CALC_S18_30]
-        )
-        self._calc_data[CALC_S19_32] = net_rad_eto(self._calc_data[CALC_S19_31])
+        rn = net_rad(rns, rnl)
+        rng = net_rad_eto(rn)
 
         """FS1. Radiation term (ETrad)"""
-        self._calc_data[CALC_FS_33] = radiation_term(
-            self._calc_data[CALC_S7_12], self._calc_data[CALC_S19_32]
-        )
+        rad_term = radiation_term(dt, rng)
 
         """FS2. Wind term (ETwind)"""
-        self._calc_data[CALC_FS_34] = wind_term(
-            self._calc_data[CALC_S8_13],
-            self._calc_data[CALC_S9_14],
-            self._calc_data[CALC_S11_19],
-            self._calc_data[CALC_S10_18],
-        )
+        wnd_term = wind_term(pt, tt, avp, svp_mean)
 
         """Final Reference Evapotranspiration Value (ETo)"""
-        self._calc_data[CALC_FSETO_35] = eto(
-            self._calc_data[CALC_FS_34], self._calc_data[CALC_FS_33]
+        calc.update(
+            {
+                CALC_S1_5: t_mean,
+                CALC_S2_6: rs,
+                CALC_S3_7: u2,
+                CALC_S4_9: delta,
+                CALC_S5_10: p_atm,
+                CALC_S6_11: psy,
+                CALC_S7_12: dt,
+                CALC_S8_13: pt,
+                CALC_S9_14: tt,
+                CALC_S10_16: svp_tmax,
+                CALC_S10_17: svp_tmin,
+                CALC_S10_18: svp_mean,
+                CALC_S11_19: avp,
+                CALC_S12_23: dr,
+                CALC_S12_24: sd,
+                CALC_S13_25: lat_rad,
+                CALC_S14_26: sha,
+                CALC_S15_27: ra,
+                CALC_S16_28: rso,
+                CALC_S17_29: rns,
+                CALC_S18_30: rnl,
+                CALC_S19_31: rn,
+                CALC_S19_32: rng,
+                CALC_FS_33: rad_term,
+                CALC_FS_34: wnd_term,
+                CALC_FSETO_35: eto(wnd_term, rad_term),
+            }
         )
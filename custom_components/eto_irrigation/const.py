@@ -56,6 +56,7 @@ CALC_FS_34 = "calc_wind_term_ETwind"
 CALC_FSETO_35 = "calc_evapotranspiration_ETo"
 
 # OTHER FACTORS
+KMH_TO_MS_FACTOR = 1 / 3.6  # km/h * factor = m/s
 W_TO_MJ_DAY_FACTOR = 0.0864  # w * factor = mj/day, same for w/m2 to mj/day/m2
 K_TO_C_FACTOR = 273.15  # K-factor = C, C+factor=K
 SOLAR_CONSTANT = 0.0820  # MJ m-2 min-1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -39,11 +40,15 @@ class ETODataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize."""
         self._eto_client = eto_client
 
+        # primarily push-driven via the state-change listener registered in
+        # async_setup_entry; the coarse interval matches real weather-sensor
+        # cadence and exists to pick up the midnight day-of-year rollover
+        # (and recover from missed events) when the inputs sit still
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=10),
+            update_interval=timedelta(minutes=30),
         )
 
     async def _async_update_data(self) -> Any:
@@ -59,7 +64,8 @@ class ETODataUpdateCoordinator(DataUpdateCoordinator):
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Fetch and process state change event."""
-        _LOGGER.debug("Entity state change: %s", event)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Entity state change: %s", event)
         if (
             (entity_id := event.data["entity_id"]) is None
             or (new_state := event.data["new_state"]) is None
@@ -67,7 +73,17 @@ class ETODataUpdateCoordinator(DataUpdateCoordinator):
         ):
             _LOGGER.debug("skipping entity update for some reason")
             return
-        _LOGGER.debug("new state = %s", float(new_state.state))
-        await self._eto_client.entity_update(entity_id, float(new_state.state))
-        """self.state_change = True"""
-        await self.async_refresh()
+        try:
+            value = float(new_state.state)
+        except ValueError:
+            _LOGGER.debug(
+                "ignoring non-numeric state for %s: %s", entity_id, new_state.state
+            )
+            return
+        _LOGGER.debug("new state = %s", value)
+        if not self._eto_client.entity_update(entity_id, value):
+            _LOGGER.debug("value unchanged; skipping refresh")
+            return
+        # debounced via the coordinator's request-refresh cooldown so a
+        # burst of sensor updates coalesces into one recompute
+        await self.async_request_refresh()
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from operator import itemgetter
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -10,11 +11,10 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfLength
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
-from .api import ETOApiClientError
 from .const import (
-    _LOGGER,
     ATTR_API_RUNTIME,
     ATTRIBUTION,
     CALC_FSETO_35,
@@ -34,11 +34,24 @@ from .const import (
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
-    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
     from .coordinator import ETODataUpdateCoordinator
     from .data import ETOConfigEntry
 
+# attribute keys published on the ETO sensor, fetched from coordinator
+# data in one C-level itemgetter call
+_ATTR_KEYS = (
+    CONF_TEMP_MIN,
+    CONF_TEMP_MAX,
+    CONF_HUMIDITY_MIN,
+    CONF_HUMIDITY_MAX,
+    CONF_WIND,
+    CONF_ALBEDO,
+    CONF_SOLAR_RAD,
+    CONF_DOY,
+)
+_ATTR_GETTER = itemgetter(*_ATTR_KEYS)
+
 SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
         key=ATTR_API_RUNTIME,
@@ -61,20 +74,21 @@ async def async_setup_entry(
     name = domain_data.name
     weather_coordinator = domain_data.coordinator
 
-    entities: list[AbstractETOSensor] = [
-        ETOSensor(
-            name,
-            f"{name}-{description.key}",
-            description,
-            weather_coordinator,
-        )
-        for description in SENSOR_TYPES
-    ]
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            ETOSensor(
+                name,
+                f"{name}-{description.key}",
+                description,
+                weather_coordinator,
+            )
+            for description in SENSOR_TYPES
+        ]
+    )
 
 
-class AbstractETOSensor(SensorEntity):
-    """Abstract class for an OpenWeatherMap sensor."""
+class ETOSensor(SensorEntity):
+    """eto_irrigation Sensor class."""
 
     _attr_should_poll = False
     _attr_attribution = ATTRIBUTION
@@ -84,11 +98,11 @@ class AbstractETOSensor(SensorEntity):
         name: str,
         unique_id: str,
         description: SensorEntityDescription,
-        coordinator: DataUpdateCoordinator,
+        coordinator: ETODataUpdateCoordinator,
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
-        self._coordinator = coordinator
+        self.coordinator = coordinator
 
         self._attr_name = f"{name} {description.name}"
         self._attr_unique_id = unique_id
@@ -103,57 +117,36 @@ class AbstractETOSensor(SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._coordinator.last_update_success
+        return self.coordinator.last_update_success
 
     async def async_added_to_hass(self) -> None:
         """Connect to dispatcher listening for entity data notifications."""
         self.async_on_remove(
-            self._coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
+        self._refresh_from_coordinator()
 
     async def async_update(self) -> None:
-        """Get the latest data from OWM and updates the states."""
-        await self._coordinator.async_request_refresh()
-
-
-class ETOSensor(AbstractETOSensor):
-    """eto_irrigation Sensor class."""
-
-    def __init__(
-        self,
-        name: str,
-        unique_id: str,
-        entity_description: SensorEntityDescription,
-        coordinator: ETODataUpdateCoordinator,
-    ) -> None:
-        """Initialize the sensor class."""
-        super().__init__(name, unique_id, entity_description, coordinator)
-        self.coordinator = coordinator
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the native value of the sensor."""
-        return self.coordinator.data[CALC_FSETO_35]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the device specific state attributes."""
-        attributes: dict[str, Any] = {}
-
-        try:
-            attributes[CONF_TEMP_MIN] = self.coordinator.data[CONF_TEMP_MIN]
-            attributes[CONF_TEMP_MAX] = self.coordinator.data[CONF_TEMP_MAX]
-            attributes[CONF_HUMIDITY_MIN] = self.coordinator.data[CONF_HUMIDITY_MIN]
-            attributes[CONF_HUMIDITY_MAX] = self.coordinator.data[CONF_HUMIDITY_MAX]
-            attributes[CONF_WIND] = (
-                None
-                if self.coordinator.data[CONF_WIND] is None
-                else round(self.coordinator.data[CONF_WIND], 1)
-            )
-            attributes[CONF_ALBEDO] = self.coordinator.data[CONF_ALBEDO]
-            attributes[CONF_SOLAR_RAD] = self.coordinator.data[CONF_SOLAR_RAD]
-            attributes[CONF_DOY] = self.coordinator.data[CONF_DOY]
-        except ETOApiClientError as ex:
-            _LOGGER.exception(ex)
-
-        return attributes
+        """Get the latest data from the coordinator and update the state."""
+        await self.coordinator.async_request_refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state and push it to Home Assistant."""
+        self._refresh_from_coordinator()
+        self.async_write_ha_state()
+
+    @callback
+    def _refresh_from_coordinator(self) -> None:
+        """
+        Cache value and attributes from coordinator data.
+
+        Runs once per coordinator update so that the native_value and
+        extra_state_attributes read paths are plain attribute loads no
+        matter how often templates or the recorder read the entity.
+        """
+        data = self.coordinator.data
+        self._attr_native_value = data[CALC_FSETO_35]
+        self._attr_extra_state_attributes = dict(
+            zip(_ATTR_KEYS, _ATTR_GETTER(data), strict=True)
+        )